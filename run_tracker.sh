@@ -17,6 +17,11 @@ if [ -d "downloads" ]; then
   find downloads -mindepth 1 -maxdepth 1 -type d -name "????-??-??" -mtime +3 -print -exec rm -rf {} +
 fi
 
+# Prune LLM replies cached more than 7 days ago; the cache otherwise grows by one file per paper.
+if [ -d "downloads/.llm_cache" ]; then
+  find downloads/.llm_cache -type f -name "*.json" -mtime +7 -delete
+fi
+
 DEFAULT_ARGS=(
   --last-n-days 1
   --max-results 1000
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+import functools
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
+import tempfile
 import textwrap
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 
 import requests
 
 from .config import AnalystConfig
+from .http_session import build_session
 from .harvester import Paper
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pypdfium2 as pdfium  # C++ PDFium; much faster text extraction than pypdf
+except ImportError:  # pragma: no cover - optional dependency
+    pdfium = None
+
 try:
     from pypdf import PdfReader
 except ImportError:  # pragma: no cover - optional dependency
@@ -30,18 +42,137 @@ SUMMARY_PROMPT = """\
 仅返回 JSON。
 """
 
+BATCH_SUMMARY_PROMPT = """\
+你是一名资深推荐算法工程师。下面给出 {count} 篇论文（以 --- 分隔），请逐篇输出总结，字段：
+1. 一句话核心创新点 (one_liner)
+2. 解决的问题 (problem)
+3. 核心方法/架构 (method)
+4. 实验结论 (results)
+5. 工业界应用价值：评分 1-5 及理由 (industry_value)
+仅返回长度为 {count} 的 JSON 数组，按论文顺序排列，每个元素是一篇论文的 JSON 对象。
+"""
+
+SUMMARY_MAX_PAGES = 6
+SUMMARY_MAX_CHARS = 4000
+
 
 class Analyst:
     def __init__(self, config: AnalystConfig | None = None):
         self.config = config or AnalystConfig()
+        self.session = build_session()
 
     def summarize_pdf(self, pdf_path: Path) -> str:
         if not self.config.api_key:
             raise RuntimeError("DEEPSEEK_API_KEY not set; cannot run summarization.")
-        text = self._extract_text(pdf_path, max_pages=6)
+        text = self._extract_text(pdf_path, max_pages=SUMMARY_MAX_PAGES)
+        return self._summarize_text(text)
+
+    def summarize_many(
+        self,
+        pdf_paths: Sequence[Path],
+        k: int = 1,
+        max_workers: int = 4,
+    ) -> list[str | None]:
+        # With k > 1, packs up to k papers per request (each truncated to SUMMARY_MAX_CHARS // k)
+        # to amortize per-call latency; groups run concurrently. Failed papers yield None.
+        if not self.config.api_key:
+            raise RuntimeError("DEEPSEEK_API_KEY not set; cannot run summarization.")
+        k = max(1, k)
+        groups = [list(range(i, min(i + k, len(pdf_paths)))) for i in range(0, len(pdf_paths), k)]
+        # Full-length texts are extracted here, before any thread starts: PDFium is not
+        # thread-safe, and the per-paper fallback of a failed batch needs the full text.
+        texts = self._extract_texts(pdf_paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            replies = executor.map(
+                lambda group: self._summarize_group(
+                    [pdf_paths[i] for i in group],
+                    [texts[i] for i in group],
+                    SUMMARY_MAX_CHARS // k,
+                ),
+                groups,
+            )
+            return [summary for group_replies in replies for summary in group_replies]
+
+    def _extract_texts(self, pdf_paths: Sequence[Path]) -> list[str | None]:
+        jobs = [(pdf_path, SUMMARY_MAX_PAGES, SUMMARY_MAX_CHARS) for pdf_path in pdf_paths]
+        if pdfium is None and len(jobs) > 1:
+            # pypdf extraction is CPU-bound Python, so spread PDFs across processes. Spawned
+            # workers avoid inheriting locks held by this process's HTTP threads. PDFium takes
+            # milliseconds per PDF, far less than starting the pool, so it runs inline.
+            with ProcessPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, len(jobs)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = [executor.submit(extract_pdf_text, *job) for job in jobs]
+            results = [future.result for future in futures]
+        else:
+            results = [functools.partial(extract_pdf_text, *job) for job in jobs]
+
+        texts: list[str | None] = []
+        for pdf_path, result in zip(pdf_paths, results):
+            try:
+                texts.append(result())
+            except Exception as exc:
+                logger.error("Failed to summarize %s: %s", pdf_path, exc)
+                texts.append(None)
+        return texts
+
+    def _summarize_group(
+        self, pdf_paths: list[Path], texts: list[str | None], max_chars: int
+    ) -> list[str | None]:
+        # Runs on worker threads, so it only ever sees extracted text, never a PDF.
+        results: list[str | None] = [None] * len(pdf_paths)
+        live = [(idx, text) for idx, text in enumerate(texts) if text is not None]
+        if len(live) == 1:
+            idx, text = live[0]
+            results[idx] = self._summarize_one(pdf_paths[idx], text)
+        if len(live) <= 1:
+            return results
+
+        papers = "\n---\n".join(
+            f"Paper {n}:\n{_truncate(text, max_chars)}" for n, (_, text) in enumerate(live, start=1)
+        )
+        prompt = BATCH_SUMMARY_PROMPT.format(count=len(live))
+        content = f"{prompt}\n论文内容（截断预览）:\n{papers}"
+        try:
+            # Each paper needs its own output budget, or the JSON array gets cut off.
+            reply = self._cached_completion(
+                content, max_tokens=self.config.max_tokens * len(live)
+            )
+            summaries = self._parse_summary_array(reply, len(live))
+        except Exception as exc:
+            logger.warning("Batched summary failed (%s); falling back to per-paper calls.", exc)
+            summaries = [self._summarize_one(pdf_paths[idx], text) for idx, text in live]
+        for (idx, _), summary in zip(live, summaries):
+            results[idx] = summary
+        return results
+
+    def _summarize_text(self, text: str) -> str:
         content = f"{SUMMARY_PROMPT}\n\n论文内容（截断预览）:\n{text}"
-        completion = self._chat_completion(content)
-        return completion
+        return self._cached_completion(content)
+
+    def _summarize_one(self, pdf_path: Path, text: str) -> str | None:
+        try:
+            return self._summarize_text(text)
+        except Exception as exc:
+            logger.error("Failed to summarize %s: %s", pdf_path, exc)
+            return None
+
+    @staticmethod
+    def _parse_summary_array(reply: str, count: int) -> list[str]:
+        # Models often wrap JSON in Markdown fences; keep only the outermost array.
+        start, end = reply.find("["), reply.rfind("]")
+        if start < 0 or end < start:
+            raise ValueError("no JSON array in reply")
+        items = json.loads(reply[start : end + 1])
+        if not isinstance(items, list):
+            raise ValueError("reply is not a JSON array")
+        if len(items) != count:
+            raise ValueError(f"expected {count} summaries, got {len(items)}")
+        return [
+            item if isinstance(item, str) else json.dumps(item, ensure_ascii=False, indent=2)
+            for item in items
+        ]
 
     def translate_abstract(self, paper: Paper) -> str:
         if not self.config.api_key:
@@ -55,7 +186,7 @@ class Analyst:
             Abstract: {paper.summary}
             """
         ).strip()
-        return self._chat_completion(prompt, temperature=0.2)
+        return self._cached_completion(prompt, temperature=0.2)
 
     def llm_vote_is_industry(self, paper: Paper, companies: list[str]) -> bool:
         if not self.config.api_key:
@@ -71,17 +202,62 @@ class Analyst:
             回复 yes 或 no。
             """
         ).strip()
-        reply = self._chat_completion(prompt, temperature=0)
+        # Affiliations do not change between revisions, so key the vote on the unversioned id.
+        reply = self._cached_completion(
+            prompt,
+            temperature=0,
+            cache_key=f"industry-vote:{paper.base_id}:{','.join(companies)}",
+        )
         return "yes" in reply.lower()
 
+    def _cached_completion(
+        self,
+        content: str,
+        temperature: float = 0.2,
+        cache_key: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        cache_dir = self.config.cache_dir
+        # Only (near-)deterministic replies are worth replaying across runs.
+        if cache_dir is None or temperature > 0.2:
+            return self._chat_completion(content, temperature=temperature, max_tokens=max_tokens)
+        # A caller-supplied key lets near-identical prompts (e.g. v2 revisions) share one reply.
+        identity = {"key": cache_key} if cache_key is not None else {"prompt": content}
+        key = hashlib.sha256(
+            json.dumps(
+                {"model": self.config.model, "t": temperature, **identity},
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        cache_path = cache_dir / f"{key}.json"
+        try:
+            return json.loads(cache_path.read_text(encoding="utf-8"))["response"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Ignoring unreadable LLM cache entry %s: %s", cache_path, exc)
+
+        reply = self._chat_completion(content, temperature=temperature, max_tokens=max_tokens)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent workers never observe a partial entry.
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_dir, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as fh:
+                json.dump({"response": reply}, fh, ensure_ascii=False)
+            os.replace(fh.name, cache_path)
+        except OSError as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to write LLM cache entry %s: %s", cache_path, exc)
+        return reply
+
     def _chat_completion(
         self,
         content: str,
         temperature: float = 0.2,
+        max_tokens: int | None = None,
     ) -> str:
         url = self._resolve_endpoint()
         headers = {
-            "Content-Type": "application/json",
             "Authorization": f"Bearer {self.config.api_key}",
         }
         payload: Dict[str, Any] = {
@@ -90,10 +266,10 @@ class Analyst:
                 {"role": "system", "content": "You are a concise assistant."},
                 {"role": "user", "content": content},
             ],
-            "max_tokens": min(self.config.max_tokens, 8192),
+            "max_tokens": min(max_tokens or self.config.max_tokens, 8192),
             "temperature": temperature,
         }
-        resp = requests.post(url, headers=headers, data=json.dumps(payload), timeout=120)
+        resp = self.session.post(url, headers=headers, json=payload, timeout=120)
         if resp.status_code >= 400:
             # Surface server message to help debug credentials/endpoint/payload issues.
             try:
@@ -114,15 +290,59 @@ class Analyst:
             return base.replace("api.deepseek.com/chat/completions", "api.deepseek.com/v1/chat/completions")
         return base
 
-    def _extract_text(self, pdf_path: Path, max_pages: int = 5) -> str:
-        if PdfReader is None:
-            raise RuntimeError("pypdf is required for PDF parsing. Please install it.")
-        reader = PdfReader(pdf_path)
+    def _extract_text(
+        self,
+        pdf_path: Path,
+        max_pages: int = 5,
+        max_chars: int = SUMMARY_MAX_CHARS,
+    ) -> str:
+        return extract_pdf_text(pdf_path, max_pages, max_chars)
+
+
+def extract_pdf_text(
+    pdf_path: Path,
+    max_pages: int = 5,
+    max_chars: int = SUMMARY_MAX_CHARS,
+) -> str:
+    # Module-level so process pools can pickle it.
+    if pdfium is not None:
+        pages = _extract_pages_pdfium(pdf_path, max_pages)
+    elif PdfReader is not None:
+        pages = _extract_pages_pypdf(pdf_path, max_pages)
+    else:
+        raise RuntimeError("pypdfium2 or pypdf is required for PDF parsing. Please install one.")
+    return _truncate("\n".join(pages), max_chars)
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    # A plain prefix is all the prompt needs; shorten() would re-tokenize the whole text.
+    return (text[:max_chars] + " ...") if len(text) > max_chars else text
+
+
+def _extract_pages_pdfium(pdf_path: Path, max_pages: int) -> list[str]:
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
         pages = []
-        for idx, page in enumerate(reader.pages[:max_pages]):
+        for idx in range(min(max_pages, len(pdf))):
             try:
-                pages.append(page.extract_text() or "")
+                page = pdf[idx]
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
             except Exception as exc:  # pragma: no cover - defensive
                 logger.warning("Failed to read page %s: %s", idx, exc)
-        text = "\n".join(pages)
-        return textwrap.shorten(text, width=4000, placeholder=" ...")
+        return pages
+    finally:
+        pdf.close()
+
+
+def _extract_pages_pypdf(pdf_path: Path, max_pages: int) -> list[str]:
+    reader = PdfReader(pdf_path)
+    pages = []
+    for idx, page in enumerate(reader.pages[:max_pages]):
+        try:
+            pages.append(page.extract_text() or "")
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to read page %s: %s", idx, exc)
+    return pages
@@ -3,22 +3,34 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
+import functools
+import json
 import logging
+import os
 import re
-from typing import Optional
+import shutil
+import tempfile
+from typing import Optional, TextIO
 
 import requests
 
 from .config import ArchivistConfig
+from .http_session import build_session
 from .harvester import Paper
 
 logger = logging.getLogger(__name__)
 
+COPY_BUFFER_SIZE = 1 << 20
+SUMMARY_BUFFER_SIZE = 1 << 16
 
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_MULTI_UNDERSCORE = re.compile(r"_+")
+
+
+@functools.lru_cache(maxsize=1024)
 def slugify(text: str, max_length: int = 80) -> str:
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "_", text)
-    text = re.sub(r"_+", "_", text).strip("_")
+    text = _NON_ALNUM.sub("_", text.lower())
+    text = _MULTI_UNDERSCORE.sub("_", text).strip("_")
     if len(text) > max_length:
         text = text[:max_length].rstrip("_")
     return text or "paper"
@@ -31,9 +43,42 @@ def extract_date(paper: Paper) -> str:
     return date.today().isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class Archivist:
     config: ArchivistConfig = field(default_factory=ArchivistConfig)
+    session: requests.Session = field(default_factory=build_session, repr=False)
+    # Open Summary.md handles keyed by day folder; released by close().
+    _summary_handles: dict[Path, TextIO] = field(default_factory=dict, init=False, repr=False)
+    # arXiv ids fully processed by earlier runs, persisted in base_dir/seen_ids.json.
+    _seen_ids: set[str] = field(default_factory=set, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        try:
+            self._seen_ids = set(json.loads(self._seen_path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning("Ignoring unreadable %s: %s", self._seen_path, exc)
+
+    @property
+    def _seen_path(self) -> Path:
+        return self.config.base_dir / "seen_ids.json"
+
+    def is_seen(self, arxiv_id: str) -> bool:
+        return arxiv_id in self._seen_ids
+
+    def mark_seen(self, *arxiv_ids: str) -> None:
+        new_ids = set(arxiv_ids) - self._seen_ids
+        if not new_ids:
+            return
+        self._seen_ids |= new_ids
+        self.config.base_dir.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so an interrupted run never leaves a truncated file behind.
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.config.base_dir, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as fh:
+            json.dump(sorted(self._seen_ids), fh)
+        os.replace(fh.name, self._seen_path)
 
     def ensure_folder(self, day: str) -> Path:
         target = self.config.base_dir / day
@@ -55,14 +100,33 @@ class Archivist:
 
         target_path = self.build_pdf_path(paper, company)
         logger.info("Downloading %s to %s", paper.pdf_url, target_path)
-        with requests.get(paper.pdf_url, stream=True, timeout=60) as resp:
+        with self.session.get(paper.pdf_url, stream=True, timeout=60) as resp:
             resp.raise_for_status()
-            with open(target_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            # Let urllib3 undo any Content-Encoding, then copy in C with a 1 MiB buffer.
+            resp.raw.decode_content = True
+            with open(target_path, "wb", buffering=COPY_BUFFER_SIZE) as f:
+                self._preallocate(f, resp)
+                shutil.copyfileobj(resp.raw, f, length=COPY_BUFFER_SIZE)
+                # Drop any preallocated tail if the body came up short.
+                f.truncate()
         return target_path
 
+    @staticmethod
+    def _preallocate(fh, resp: requests.Response) -> None:
+        # Reserve the whole extent up front so concurrent downloads don't grow files block by block.
+        if not hasattr(os, "posix_fallocate") or resp.headers.get("Content-Encoding"):
+            return
+        try:
+            size = int(resp.headers.get("Content-Length", ""))
+        except ValueError:
+            return
+        if size <= 0:
+            return
+        try:
+            os.posix_fallocate(fh.fileno(), 0, size)
+        except OSError as exc:  # pragma: no cover - unsupported filesystem
+            logger.debug("posix_fallocate unavailable for %s: %s", fh.name, exc)
+
     def write_summary_markdown(self, pdf_path: Path, summary: str, header: str) -> Path:
         md_path = pdf_path.with_suffix(".md")
         md_path.write_text(f"# {header}\n\n{summary}\n", encoding="utf-8")
@@ -70,6 +134,16 @@ class Archivist:
         return md_path
 
     def _append_to_daily_summary(self, folder: Path, header: str, summary: str) -> None:
-        summary_path = folder / "Summary.md"
-        with open(summary_path, "a", encoding="utf-8") as fh:
-            fh.write(f"## {header}\n\n{summary}\n\n---\n\n")
+        fh = self._summary_handles.get(folder)
+        if fh is None:
+            fh = open(folder / "Summary.md", "a", encoding="utf-8", buffering=SUMMARY_BUFFER_SIZE)
+            self._summary_handles[folder] = fh
+        fh.write(f"## {header}\n\n{summary}\n\n---\n\n")
+
+    def close(self) -> None:
+        while self._summary_handles:
+            _, fh = self._summary_handles.popitem()
+            try:
+                fh.close()
+            except OSError as exc:  # pragma: no cover - defensive
+                logger.warning("Failed to flush %s: %s", fh.name, exc)
@@ -61,6 +61,10 @@ class SearchConfig:
     last_n_days: int = 1  # yesterday by default
     max_results: int = 500
     page_size: int = 100
+    # arXiv's API terms ask for one connection at a time, ~3 s apart; raising fetch_workers
+    # fetches the remaining pages concurrently instead (opt-in, risks 503 throttling).
+    fetch_workers: int = 1
+    request_interval: float = 3.0
 
     @property
     def since(self) -> date:
@@ -89,6 +93,9 @@ class AnalystConfig:
     model: str = os.environ.get("LLM_MODEL", "deepseek-chat")
     base_url: str | None = os.environ.get("LLM_BASE_URL", "https://api.deepseek.com/v1/chat/completions")
     max_tokens: int = 2048  # DeepSeek limit is 8192; keep conservative default.
+    # On-disk reply cache for deterministic prompts; set to None to always call the API.
+    # AppConfig moves the default under ArchivistConfig.base_dir.
+    cache_dir: Path | None = Path("downloads") / ".llm_cache"
 
     @property
     def api_key(self) -> str | None:
@@ -104,6 +111,11 @@ class AppConfig:
     analyst: AnalystConfig = field(default_factory=AnalystConfig)
     telegram: "TelegramConfig" = field(default_factory=lambda: TelegramConfig())
 
+    def __post_init__(self) -> None:
+        # Keep the LLM cache beside the downloads (and their cleanup) unless set explicitly.
+        if self.analyst.cache_dir == AnalystConfig.cache_dir:
+            self.analyst.cache_dir = self.archivist.base_dir / ".llm_cache"
+
 
 @dataclass
 class TelegramConfig:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import bisect
 import logging
 import re
 from typing import Callable, Iterable
@@ -11,7 +12,7 @@ from .harvester import Paper
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FilterOutcome:
     accepted: bool
     level: str | None = None
@@ -19,12 +20,17 @@ class FilterOutcome:
     evidence: str | None = None
 
 
-def compile_company_pattern(companies: Iterable[str]) -> re.Pattern[str]:
-    escaped = [re.escape(c.lower()) for c in companies]
+def compile_keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    # One alternation scanned in C instead of a Python loop of substring tests.
+    escaped = [re.escape(k.lower()) for k in keywords]
     joined = "|".join(escaped)
     return re.compile(joined, re.IGNORECASE)
 
 
+def compile_company_pattern(companies: Iterable[str]) -> re.Pattern[str]:
+    return compile_keyword_pattern(companies)
+
+
 class Gatekeeper:
     def __init__(self, config: GatekeeperConfig | None = None):
         self.config = config or GatekeeperConfig()
@@ -44,12 +50,19 @@ class Gatekeeper:
         meta_fields.append(" ".join([a.name for a in paper.authors]))
         meta_fields.append(paper.title)
         meta_fields.append(paper.summary)
+        # One regex pass over all fields; the leftmost hit lies in the first matching field.
+        # Whitelist entries never contain the NUL separator, so matches cannot span fields.
+        starts = []
+        pos = 0
         for field in meta_fields:
-            match = self.pattern.search(field)
-            if match:
-                return FilterOutcome(
-                    accepted=True, level="metadata", company=match.group(0), evidence=field
-                )
+            starts.append(pos)
+            pos += len(field) + 1
+        match = self.pattern.search("\x00".join(meta_fields))
+        if match:
+            field = meta_fields[bisect.bisect_right(starts, match.start()) - 1]
+            return FilterOutcome(
+                accepted=True, level="metadata", company=match.group(0), evidence=field
+            )
 
         # Level 2: optional email domain scan
         if email_text:
@@ -1,27 +1,55 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
-from typing import Iterable, List
+from typing import Any, Iterable, Iterator, List
+import io
 import logging
+import re
 import textwrap
+import time
 import urllib.parse
-import xml.etree.ElementTree as ET
-
-import requests
 
 from .config import SearchConfig
+from .http_session import build_session
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+try:
+    from lxml import etree as ET  # C-backed parser; much faster on large feeds
+    _LXML = True
+except ImportError:  # pragma: no cover - optional dependency
+    import xml.etree.ElementTree as ET
+    _LXML = False
+
+_VERSION_SUFFIX = re.compile(r"v\d+$")
+
+# Expanded ("Clark notation") tag names, so lookups skip prefix resolution per call.
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_OPENSEARCH = "{http://a9.com/-/spec/opensearch/1.1/}"
+_ENTRY = f"{_ATOM}entry"
+_ID = f"{_ATOM}id"
+_TITLE = f"{_ATOM}title"
+_SUMMARY = f"{_ATOM}summary"
+_PUBLISHED = f"{_ATOM}published"
+_UPDATED = f"{_ATOM}updated"
+_AUTHOR = f"{_ATOM}author"
+_NAME = f"{_ATOM}name"
+_LINK = f"{_ATOM}link"
+_CATEGORY = f"{_ATOM}category"
+_AFFILIATION = f"{_ARXIV}affiliation"
+_TOTAL_RESULTS = f"{_OPENSEARCH}totalResults"
+
+
+@dataclass(slots=True, frozen=True)
 class Author:
     name: str
     affiliation: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Paper:
     arxiv_id: str
     title: str
@@ -36,17 +64,18 @@ class Paper:
     def first_author(self) -> str:
         return self.authors[0].name if self.authors else "unknown"
 
+    @property
+    def base_id(self) -> str:
+        # arXiv id without the trailing version suffix (e.g. "...2401.01234v2" -> "...2401.01234").
+        return _VERSION_SUFFIX.sub("", self.arxiv_id)
+
 
 class ArxivHarvester:
     API_URL = "http://export.arxiv.org/api/query"
-    NS = {
-        "atom": "http://www.w3.org/2005/Atom",
-        "arxiv": "http://arxiv.org/schemas/atom",
-        "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
-    }
 
     def __init__(self, config: SearchConfig | None = None):
         self.config = config or SearchConfig()
+        self.session = build_session()
 
     def _build_query(
         self,
@@ -76,20 +105,36 @@ class ArxivHarvester:
             end_date,
         )
 
-        papers: list[Paper] = []
-        start = 0
-        while start < cfg.max_results:
-            chunk = self._fetch_chunk(query=query, start=start, max_results=cfg.page_size)
-            if not chunk:
-                break
-            papers.extend(chunk)
-            if len(chunk) < cfg.page_size:
-                break
-            start += cfg.page_size
+        papers, total = self._fetch_chunk(query=query, start=0, max_results=cfg.page_size)
+        if len(papers) >= cfg.page_size:
+            # Once the first page reports the total, the remaining offsets are known.
+            stop = cfg.max_results if total is None else min(total, cfg.max_results)
+            starts = range(cfg.page_size, stop, cfg.page_size)
+            if cfg.fetch_workers > 1:
+                with ThreadPoolExecutor(max_workers=cfg.fetch_workers) as executor:
+                    chunks = executor.map(
+                        lambda start: self._fetch_chunk(
+                            query=query, start=start, max_results=cfg.page_size
+                        )[0],
+                        starts,
+                    )
+                    for chunk in chunks:
+                        papers.extend(chunk)
+            else:
+                for start in starts:
+                    time.sleep(cfg.request_interval)
+                    chunk, _ = self._fetch_chunk(
+                        query=query, start=start, max_results=cfg.page_size
+                    )
+                    papers.extend(chunk)
+                    if len(chunk) < cfg.page_size:
+                        break
         logger.info("Fetched %s papers", len(papers))
         return papers
 
-    def _fetch_chunk(self, query: str, start: int, max_results: int) -> list[Paper]:
+    def _fetch_chunk(
+        self, query: str, start: int, max_results: int
+    ) -> tuple[list[Paper], int | None]:
         params = {
             "search_query": query,
             "start": start,
@@ -97,38 +142,51 @@ class ArxivHarvester:
             "sortBy": "submittedDate",
             "sortOrder": "descending",
         }
-        headers = {"User-Agent": "arxiv-paper-hunter/0.1"}
-        response = requests.get(self.API_URL, params=params, headers=headers, timeout=30)
+        response = self.session.get(self.API_URL, params=params, timeout=30)
         response.raise_for_status()
-        return self._parse_feed(response.text)
-
-    def _parse_feed(self, xml_text: str) -> list[Paper]:
-        root = ET.fromstring(xml_text)
+        return self._parse_feed(response.content)
+
+    def _iter_elements(self, xml_bytes: bytes, tags: tuple[str, ...]) -> Iterator[Any]:
+        source = io.BytesIO(xml_bytes)
+        if _LXML:
+            events = ET.iterparse(source, events=("end",), tag=tags)
+        else:
+            events = ET.iterparse(source, events=("end",))
+        for _, elem in events:
+            if elem.tag in tags:
+                yield elem
+
+    def _parse_feed(self, xml_bytes: bytes) -> tuple[list[Paper], int | None]:
+        # Stream entries and free each one once read instead of building the whole tree.
         papers: list[Paper] = []
-        for entry in root.findall("atom:entry", self.NS):
-            arxiv_id = entry.findtext("atom:id", default="", namespaces=self.NS)
-            title = self._clean(entry.findtext("atom:title", default="", namespaces=self.NS))
-            summary = self._clean(entry.findtext("atom:summary", default="", namespaces=self.NS))
-            published = entry.findtext("atom:published", default="", namespaces=self.NS)
-            updated = entry.findtext("atom:updated", default="", namespaces=self.NS)
+        total: int | None = None
+        for entry in self._iter_elements(xml_bytes, (_ENTRY, _TOTAL_RESULTS)):
+            if entry.tag == _TOTAL_RESULTS:
+                try:
+                    total = int((entry.text or "").strip())
+                except ValueError:
+                    logger.debug("Unparseable totalResults: %r", entry.text)
+                continue
+            arxiv_id = entry.findtext(_ID, default="")
+            title = self._clean(entry.findtext(_TITLE, default=""))
+            summary = self._clean(entry.findtext(_SUMMARY, default=""))
+            published = entry.findtext(_PUBLISHED, default="")
+            updated = entry.findtext(_UPDATED, default="")
             authors = [
                 Author(
-                    name=self._clean(author.findtext("atom:name", default="", namespaces=self.NS)),
-                    affiliation=self._clean(
-                        author.findtext("arxiv:affiliation", default="", namespaces=self.NS)
-                    )
-                    or None,
+                    name=self._clean(author.findtext(_NAME, default="")),
+                    affiliation=self._clean(author.findtext(_AFFILIATION, default="")) or None,
                 )
-                for author in entry.findall("atom:author", self.NS)
+                for author in entry.findall(_AUTHOR)
             ]
             pdf_url = None
-            for link in entry.findall("atom:link", self.NS):
+            for link in entry.findall(_LINK):
                 if link.attrib.get("type") == "application/pdf":
                     pdf_url = link.attrib.get("href")
                     break
             categories = [
                 link.attrib.get("term", "")
-                for link in entry.findall("atom:category", self.NS)
+                for link in entry.findall(_CATEGORY)
                 if link.attrib.get("term")
             ]
             papers.append(
@@ -143,7 +201,8 @@ class ArxivHarvester:
                     categories=categories,
                 )
             )
-        return papers
+            entry.clear()
+        return papers, total
 
     @staticmethod
     def _clean(text: str | None) -> str:
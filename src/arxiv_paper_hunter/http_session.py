@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "arxiv-paper-hunter/0.1"
+
+
+def build_session(
+    pool_connections: int = 16,
+    pool_maxsize: int = 32,
+    retries: int = 3,
+) -> requests.Session:
+    # Keep-alive pool shared by a component; retries transient 429/5xx on idempotent calls.
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Hand the last response back so callers keep surfacing server error details.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
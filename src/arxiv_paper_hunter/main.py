@@ -1,16 +1,95 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import logging
-from typing import List
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Iterable, Iterator, List
 
 from .analyst import Analyst
 from .archivist import Archivist
 from .config import AppConfig, SearchConfig
-from .gatekeeper import Gatekeeper, FilterOutcome
-from .harvester import ArxivHarvester
+from .gatekeeper import Gatekeeper, FilterOutcome, compile_keyword_pattern
+from .harvester import ArxivHarvester, Paper
 from .notifier import TelegramNotifier
-from .pdf_assets import PdfAssets, extract_first_page_image
+from .pdf_assets import PdfAssets, extract_assets_batch
+
+
+DOWNLOAD_WORKERS = 8
+LLM_WORKERS = 4
+
+
+def _fetch_paper(archivist: Archivist, paper: Paper, outcome: FilterOutcome) -> tuple:
+    pdf_path = archivist.download_pdf(paper, outcome.company)
+    return paper, outcome, pdf_path
+
+
+def download_accepted(
+    candidates: Iterable[tuple[Paper, FilterOutcome]],
+    archivist: Archivist,
+    limit: int | None = None,
+    max_workers: int = DOWNLOAD_WORKERS,
+) -> list[tuple]:
+    # Candidates are consumed lazily so gatekeeping (and any LLM vote) stops once enough
+    # downloads are in flight; a failed download frees its slot for the next candidate.
+    results: dict[int, tuple] = {}
+    pending: dict[Future, tuple[int, Paper]] = {}
+
+    def collect(done) -> None:
+        for future in done:
+            idx, paper = pending.pop(future)
+            try:
+                results[idx] = future.result()
+            except Exception as exc:
+                logging.error("Failed to download %s: %s", paper.title, exc)
+
+    remaining = iter(candidates)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for idx in itertools.count():
+            # Wait while the pool is saturated or in-flight work could already meet the limit.
+            while pending and (
+                len(pending) >= max_workers or (limit and len(results) + len(pending) >= limit)
+            ):
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            # Check before pulling: the next candidate may cost a gatekeeper LLM vote.
+            if limit and len(results) >= limit:
+                break
+            candidate = next(remaining, None)
+            if candidate is None:
+                break
+            paper, outcome = candidate
+            future = executor.submit(_fetch_paper, archivist, paper, outcome)
+            pending[future] = (idx, paper)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    return [results[idx] for idx in sorted(results)]
+
+
+def format_translation_message(paper: Paper, zh: str, assets: PdfAssets) -> str:
+    authors_fmt = "; ".join(
+        [
+            f"{a.name}" + (f" ({a.affiliation})" if a.affiliation else "")
+            for a in paper.authors
+        ]
+    )
+    affiliations = [a.affiliation for a in paper.authors if a.affiliation]
+    affiliations_fmt = "; ".join(dict.fromkeys(affiliations)) if affiliations else "N/A"
+    categories_fmt = ", ".join(paper.categories) if paper.categories else "N/A"
+    return (
+        f"Title: {paper.title}\n"
+        f"arXiv: {paper.arxiv_id}\n"
+        f"Published: {paper.published or 'N/A'}\n"
+        f"Updated: {paper.updated or 'N/A'}\n"
+        f"Authors: {authors_fmt or 'N/A'}\n"
+        f"Affiliations: {affiliations_fmt}\n"
+        f"Keywords/Categories: {categories_fmt}\n"
+        f"Chinese translation:\n{zh}\n"
+        f"Cover Image: {assets.cover_image or 'N/A'}"
+    )
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -42,11 +121,29 @@ def build_parser() -> argparse.ArgumentParser:
         default=500,
         help="Maximum number of papers to fetch (default: 500).",
     )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=1,
+        help=(
+            "Result pages fetched concurrently (default: 1, one request every 3 s as arXiv's "
+            "API terms ask). Higher values are faster but risk 503 throttling."
+        ),
+    )
     parser.add_argument(
         "--no-summary",
         action="store_true",
         help="Skip LLM summarization (still downloads PDFs).",
     )
+    parser.add_argument(
+        "--summary-batch-size",
+        type=int,
+        default=1,
+        help=(
+            "Papers packed into one LLM summary request (default: 1, no batching). Larger "
+            "values save calls but give each paper a shorter text preview."
+        ),
+    )
     parser.add_argument(
         "--translate-abstracts",
         action="store_true",
@@ -72,6 +169,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Drop papers whose title/abstract do not contain any keyword (post-filter).",
     )
+    parser.add_argument(
+        "--ignore-seen",
+        action="store_true",
+        help="Reprocess papers that earlier runs already handled (see downloads/seen_ids.json).",
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -103,6 +205,7 @@ def main(argv: List[str] | None = None) -> int:
         last_n_days=args.last_n_days,
         max_results=args.max_results,
         page_size=app_cfg.search.page_size,
+        fetch_workers=args.fetch_workers,
     )
     app_cfg.search = search_cfg
 
@@ -134,8 +237,6 @@ def main(argv: List[str] | None = None) -> int:
         except Exception as exc:
             logging.error("Failed to push harvest summary to Telegram: %s", exc)
 
-    accepted = 0
-    downloaded: list[tuple] = []
     llm_checker = (
         lambda paper: analyst.llm_vote_is_industry(
             paper, gatekeeper.config.company_whitelist
@@ -144,90 +245,106 @@ def main(argv: List[str] | None = None) -> int:
         else None
     )
 
+    keyword_pattern = compile_keyword_pattern(app_cfg.search.keywords)
+
     def keyword_hit(paper) -> bool:
-        text = f"{paper.title} {paper.summary}".lower()
-        return any(kw.lower() in text for kw in app_cfg.search.keywords)
-
-    for paper in papers:
-        if args.require_keyword_match and not keyword_hit(paper):
-            logging.debug("Skip (keyword miss): %s", paper.title)
-            continue
-        if args.skip_gatekeeper:
-            outcome = FilterOutcome(accepted=True, level="skipped", company=None, evidence=None)
-        else:
-            outcome = gatekeeper.filter(paper, email_text=None, llm_checker=llm_checker)
-        if not outcome.accepted:
-            continue
-        try:
-            pdf_path = archivist.download_pdf(paper, outcome.company)
-            asset_dir = pdf_path.parent / "images"
-            cover = extract_first_page_image(pdf_path, asset_dir)
-            assets = PdfAssets(cover_image=cover, figures=[])
-            downloaded.append((paper, outcome, pdf_path, assets))
-        except Exception as exc:
-            logging.error("Failed to download %s: %s", paper.title, exc)
-            continue
+        return keyword_pattern.search(f"{paper.title} {paper.summary}") is not None
 
-        accepted += 1
-        if args.limit and accepted >= args.limit:
-            break
+    def candidates() -> Iterator[tuple[Paper, FilterOutcome]]:
+        for paper in papers:
+            if not args.ignore_seen and archivist.is_seen(paper.arxiv_id):
+                logging.debug("Skip (already processed): %s", paper.title)
+                continue
+            if args.require_keyword_match and not keyword_hit(paper):
+                logging.debug("Skip (keyword miss): %s", paper.title)
+                continue
+            if args.skip_gatekeeper:
+                outcome = FilterOutcome(accepted=True, level="skipped", company=None, evidence=None)
+            else:
+                outcome = gatekeeper.filter(paper, email_text=None, llm_checker=llm_checker)
+            if outcome.accepted:
+                yield paper, outcome
+
+    fetched = download_accepted(candidates(), archivist, limit=args.limit)
+    # Covers only (limit=0); rendering runs across processes once all downloads are in.
+    assets_by_pdf = dict(extract_assets_batch([pdf_path for _, _, pdf_path in fetched], limit=0))
+    no_assets = PdfAssets(cover_image=None, figures=[])
+    downloaded = [
+        (paper, outcome, pdf_path, assets_by_pdf.get(pdf_path, no_assets))
+        for paper, outcome, pdf_path in fetched
+    ]
+    accepted = len(downloaded)
+    # Only papers whose requested stages all succeeded are recorded as seen, so a skipped
+    # or failed stage is retried on the next run.
+    completed = [True] * accepted
 
     if args.no_summary:
         logging.info("Summary step skipped (--no-summary).")
     else:
         if not analyst.config.api_key:
             logging.warning("DEEPSEEK_API_KEY not set; skipping summaries.")
-        for paper, outcome, pdf_path, assets in downloaded:
-            if not analyst.config.api_key:
-                continue
+            completed = [False] * accepted
+        else:
+            # Requests are batched and run concurrently; write in harvest order for Summary.md.
+            summaries = analyst.summarize_many(
+                [pdf_path for _, _, pdf_path, _ in downloaded],
+                k=args.summary_batch_size,
+                max_workers=LLM_WORKERS,
+            )
             try:
-                summary = analyst.summarize_pdf(pdf_path)
-                header = f"{paper.title} ({paper.arxiv_id})"
-                archivist.write_summary_markdown(pdf_path, summary, header)
-                logging.info("Summarized %s", paper.title)
-            except Exception as exc:
-                logging.error("Failed to summarize %s: %s", paper.title, exc)
+                for idx, ((paper, _, pdf_path, _), summary) in enumerate(zip(downloaded, summaries)):
+                    if summary is None:
+                        completed[idx] = False
+                        continue
+                    try:
+                        header = f"{paper.title} ({paper.arxiv_id})"
+                        archivist.write_summary_markdown(pdf_path, summary, header)
+                        logging.info("Summarized %s", paper.title)
+                    except Exception as exc:
+                        completed[idx] = False
+                        logging.error("Failed to summarize %s: %s", paper.title, exc)
+            finally:
+                archivist.close()
 
     if args.translate_abstracts:
         if not analyst.config.api_key:
             logging.warning("DEEPSEEK_API_KEY not set; skipping abstract translation.")
+            completed = [False] * accepted
         else:
-            for paper, _, _, assets in downloaded:
-                try:
-                    zh = analyst.translate_abstract(paper)
-                    authors_fmt = "; ".join(
-                        [
-                            f"{a.name}" + (f" ({a.affiliation})" if a.affiliation else "")
-                            for a in paper.authors
-                        ]
-                    )
-                    affiliations = [a.affiliation for a in paper.authors if a.affiliation]
-                    affiliations_fmt = "; ".join(dict.fromkeys(affiliations)) if affiliations else "N/A"
-                    categories_fmt = ", ".join(paper.categories) if paper.categories else "N/A"
-                    msg = (
-                        f"Title: {paper.title}\n"
-                        f"arXiv: {paper.arxiv_id}\n"
-                        f"Published: {paper.published or 'N/A'}\n"
-                        f"Updated: {paper.updated or 'N/A'}\n"
-                        f"Authors: {authors_fmt or 'N/A'}\n"
-                        f"Affiliations: {affiliations_fmt}\n"
-                        f"Keywords/Categories: {categories_fmt}\n"
-                        f"Chinese translation:\n{zh}\n"
-                        f"Cover Image: {assets.cover_image or 'N/A'}"
-                    )
-                    print("\n=== Abstract Translation ===")
-                    print(msg)
-                    print("===========================\n")
-                    if notifier:
-                        try:
-                            notifier.send_message(msg)
-                            if assets.cover_image:
-                                notifier.send_photo(assets.cover_image)
-                        except Exception as exc:
-                            logging.error("Failed to push to Telegram: %s", exc)
-                except Exception as exc:
-                    logging.error("Failed to translate %s: %s", paper.title, exc)
+            pushes: list[tuple[int, tuple[str, Path | None]]] = []
+            with ThreadPoolExecutor(max_workers=LLM_WORKERS) as executor:
+                futures = [
+                    executor.submit(analyst.translate_abstract, paper) for paper, _, _, _ in downloaded
+                ]
+                for idx, ((paper, _, _, assets), future) in enumerate(zip(downloaded, futures)):
+                    try:
+                        zh = future.result()
+                        msg = format_translation_message(paper, zh, assets)
+                        print("\n=== Abstract Translation ===")
+                        print(msg)
+                        print("===========================\n")
+                        pushes.append((idx, (msg, assets.cover_image)))
+                    except Exception as exc:
+                        completed[idx] = False
+                        logging.error("Failed to translate %s: %s", paper.title, exc)
+            if args.telegram:
+                # Without a notifier (missing credentials) nothing was pushed.
+                items = [item for _, item in pushes]
+                sent = notifier.send_many(items) if notifier and items else [False] * len(items)
+                for (idx, _), ok in zip(pushes, sent):
+                    if not ok:
+                        completed[idx] = False
 
+    try:
+        archivist.mark_seen(
+            *(
+                paper.arxiv_id
+                for (paper, _, _, _), done in zip(downloaded, completed)
+                if done
+            )
+        )
+    except OSError as exc:
+        logging.error("Failed to record processed papers: %s", exc)
     logging.info("Finished. Accepted %s papers.", accepted)
     return 0
 
@@ -1,21 +1,27 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Sequence
 
 import requests
 
 from .config import TelegramConfig
+from .http_session import build_session
 
 logger = logging.getLogger(__name__)
 
+CAPTION_LIMIT = 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class TelegramNotifier:
     config: TelegramConfig
+    session: requests.Session = field(default_factory=build_session, repr=False)
 
-    def send_message(self, text: str) -> None:
+    def send_message(self, text: str) -> int:
         if not self.config.token or not self.config.chat_id:
             raise RuntimeError("Telegram token or chat_id missing.")
         url = f"https://api.telegram.org/bot{self.config.token}/sendMessage"
@@ -24,10 +30,16 @@ class TelegramNotifier:
             "text": text,
             "disable_web_page_preview": True,
         }
-        resp = requests.post(url, data=payload, timeout=30)
+        resp = self.session.post(url, data=payload, timeout=30)
         resp.raise_for_status()
+        return resp.json()["result"]["message_id"]
 
-    def send_photo(self, photo_path: Path, caption: str | None = None) -> None:
+    def send_photo(
+        self,
+        photo_path: Path,
+        caption: str | None = None,
+        reply_to_message_id: int | None = None,
+    ) -> None:
         if not self.config.token or not self.config.chat_id:
             raise RuntimeError("Telegram token or chat_id missing.")
         url = f"https://api.telegram.org/bot{self.config.token}/sendPhoto"
@@ -36,7 +48,37 @@ class TelegramNotifier:
         }
         if caption:
             data["caption"] = caption
+        if reply_to_message_id is not None:
+            data["reply_to_message_id"] = reply_to_message_id
         with open(photo_path, "rb") as fh:
             files = {"photo": fh}
-            resp = requests.post(url, data=data, files=files, timeout=60)
+            resp = self.session.post(url, data=data, files=files, timeout=60)
             resp.raise_for_status()
+
+    def send_paper(self, text: str, photo_path: Path | None = None) -> None:
+        # One round-trip when the text fits as the cover's caption (Telegram counts UTF-16 units).
+        if photo_path and len(text.encode("utf-16-le")) // 2 <= CAPTION_LIMIT:
+            self.send_photo(photo_path, caption=text)
+            return
+        message_id = self.send_message(text)
+        if photo_path:
+            # Concurrent pushes can interleave, so thread the cover to its own message.
+            self.send_photo(photo_path, reply_to_message_id=message_id)
+
+    def send_many(
+        self,
+        items: Sequence[tuple[str, Path | None]],
+        max_workers: int = 4,
+    ) -> list[bool]:
+        # Papers are pushed concurrently (message, then its cover); a small pool stays well
+        # under Telegram's ~30 msg/s bot limit. Returns which items were delivered.
+        def push(item: tuple[str, Path | None]) -> bool:
+            try:
+                self.send_paper(*item)
+                return True
+            except Exception as exc:
+                logger.error("Failed to push to Telegram: %s", exc)
+                return False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(push, items))
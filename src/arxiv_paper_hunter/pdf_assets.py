@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator, Sequence
+import ctypes
+import hashlib
+import io
+import json
 import logging
+import mmap
+import multiprocessing
+import os
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +21,13 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     fitz = None
 
+try:
+    import pypdfium2 as pdfium  # Google PDFium; faster page rendering than MuPDF
+    import pypdfium2.raw as pdfium_c
+except Exception:  # pragma: no cover - optional dependency
+    pdfium = None
+    pdfium_c = None
+
 try:
     from pypdf import PdfReader
 except Exception:  # pragma: no cover - optional dependency
@@ -22,56 +39,613 @@ except Exception:  # pragma: no cover - optional dependency
     _PIL_AVAILABLE = False
 
 
+JPEG_QUALITY = 85
+
+# Images below this many pixels (e.g. 200x200) are icons, bullets or glyphs, not figures.
+MIN_FIGURE_AREA = 200 * 200
+
+# Image filters whose encoded stream is already a standalone file, keyed to its extension.
+_PASSTHROUGH_FILTERS = {"DCTDecode": "jpg", "JPXDecode": "jp2"}
+
+# Top-level "N G obj << ... >> stream" headers of image XObjects, allowing one level of
+# nested dicts (e.g. /DecodeParms). Used to slice JPEG payloads straight out of the mapping.
+_IMAGE_STREAM_HEADER = re.compile(
+    rb"(\d+)\s+\d+\s+obj\s*<<((?:[^<>]|<<[^<>]*>>)*?/Subtype\s*/Image\b"
+    rb"(?:[^<>]|<<[^<>]*>>)*?)>>\s*stream\r?\n",
+    re.DOTALL,
+)
+_SOLE_PASSTHROUGH_FILTER = re.compile(
+    rb"/Filter\s*(?:/(DCTDecode|JPXDecode)|\[\s*/(DCTDecode|JPXDecode)\s*\])"
+)
+_WIDTH = re.compile(rb"/Width\s+(\d+)")
+_HEIGHT = re.compile(rb"/Height\s+(\d+)")
+_DIRECT_LENGTH = re.compile(rb"/Length\s+(\d+)(?!\d|\s+\d+\s+R)")
+_ENDSTREAM = re.compile(rb"\s*endstream")
+
+# Path separators and other characters that are unsafe in figure file names.
+_UNSAFE_NAME_CHARS = str.maketrans({"/": "_", "\\": "_", ":": "_"})
+
+# Output directories this process has already created.
+_created_dirs: set[Path] = set()
+
+
 @dataclass
 class PdfAssets:
     cover_image: Path | None
     figures: list[Path]
 
 
-def extract_first_page_image(pdf_path: Path, output_dir: Path) -> Path | None:
-    if fitz is None:
-        logger.warning("PyMuPDF not available; skipping cover image extraction.")
-        return None
-    output_dir.mkdir(parents=True, exist_ok=True)
+def _ensure_dir(path: Path) -> None:
+    # Batches write every PDF into the same few folders; skip the EEXIST mkdir after the first.
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
+
+
+def _open_mmap(pdf_path: Path) -> mmap.mmap:
+    fd = os.open(os.fsencode(pdf_path), os.O_RDONLY)
     try:
-        doc = fitz.open(str(pdf_path))
-        if doc.page_count < 1:
+        # Copy-on-write rather than ACCESS_READ: pages still come straight from the page
+        # cache, but the buffer is writable, which ctypes needs to hand it to PDFium.
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_COPY)
+    finally:
+        os.close(fd)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return mm
+
+
+def _open_pdfium(source: Path | mmap.mmap):
+    if isinstance(source, mmap.mmap):
+        # A ctypes view over the mapping lets PDFium parse it in place instead of from a copy.
+        return pdfium.PdfDocument((ctypes.c_char * len(source)).from_buffer(source))
+    return pdfium.PdfDocument(str(source))
+
+
+def _open_fitz(source: Path | memoryview):
+    if isinstance(source, memoryview):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(str(source))
+
+
+class AssetExtractor:
+    # Maps a PDF once and parses it at most once per library, so the cover and the figures
+    # come from the same open document:
+    #
+    #     with AssetExtractor(pdf_path) as extractor:
+    #         cover = extractor.cover(output_dir)
+    #         figures = extractor.figures(output_dir, limit=3)
+
+    def __init__(self, pdf_path: Path):
+        self.pdf_path = pdf_path
+        self._mm: mmap.mmap | None = None
+        try:
+            self._mm = _open_mmap(pdf_path)
+        except (OSError, ValueError) as exc:
+            # Empty or unmappable file: let the PDF libraries open the path and report it.
+            logger.debug("Could not map %s, opening by path: %s", pdf_path, exc)
+        self._pdfium_doc = None
+        self._fitz_doc = None
+        self._fitz_view: memoryview | None = None
+        # Outputs at least this new were produced from the current file and are reused.
+        try:
+            self._pdf_mtime: float | None = os.stat(pdf_path).st_mtime
+        except OSError:
+            self._pdf_mtime = None
+
+    def __enter__(self) -> AssetExtractor:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def _source(self) -> Path | mmap.mmap:
+        return self._mm if self._mm is not None else self.pdf_path
+
+    def _pdfium(self):
+        if self._pdfium_doc is None:
+            self._pdfium_doc = _open_pdfium(self._source)
+        return self._pdfium_doc
+
+    def _fitz(self):
+        if self._fitz_doc is None:
+            source: Path | memoryview = self.pdf_path
+            if self._mm is not None:
+                # Kept so close() can release it; a live export keeps the mapping open.
+                source = self._fitz_view = memoryview(self._mm)
+            self._fitz_doc = _open_fitz(source)
+        return self._fitz_doc
+
+    def cover(
+        self,
+        output_dir: Path,
+        fmt: str = "jpeg",
+        dpi: int = 120,
+        target_width_px: int | None = None,
+    ) -> Path | None:
+        # JPEG (default) skips PNG's Deflate pass and is much smaller; fmt="png" is lossless.
+        # 120 DPI suits previews (pixel cost grows with dpi^2); pass dpi=200 for hi-res covers.
+        # target_width_px overrides dpi and renders a thumbnail of exactly that width.
+        use_pdfium = pdfium is not None and _PIL_AVAILABLE
+        if not use_pdfium and fitz is None:
+            logger.warning(
+                "Neither pypdfium2 nor PyMuPDF available; skipping cover image extraction."
+            )
             return None
-        page = doc.load_page(0)
-        pix = page.get_pixmap(dpi=200)
-        cover_path = output_dir / f"{pdf_path.stem}_page1.png"
-        pix.save(cover_path)
+        suffix = "png" if fmt == "png" else "jpg"
+        cover_path = output_dir / f"{self.pdf_path.stem}_page1.{suffix}"
+        # A sidecar manifest records the render settings, so a cover drawn at another size
+        # is re-rendered rather than reused.
+        manifest_path = output_dir / f"{self.pdf_path.stem}_page1.{suffix}.json"
+        settings = {"dpi": dpi, "target_width_px": target_width_px}
+        if self._is_fresh(cover_path) and self._load_manifest(manifest_path, settings) is not None:
+            return cover_path
+        _ensure_dir(output_dir)
+        try:
+            if use_pdfium:
+                rendered = _render_cover_pdfium(
+                    self._pdfium(), cover_path, fmt, dpi, target_width_px
+                )
+            else:
+                rendered = _render_cover_fitz(self._fitz(), cover_path, fmt, dpi, target_width_px)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to render cover image for %s: %s", self.pdf_path, exc)
+            return None
+        if not rendered:
+            return None
+        _write_manifest(manifest_path, settings)
         return cover_path
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("Failed to render cover image for %s: %s", pdf_path, exc)
-        return None
 
+    def figures(
+        self, output_dir: Path, limit: int = 3, min_area: int = MIN_FIGURE_AREA
+    ) -> list[Path]:
+        # Prefer whichever library can reuse an open document; pypdf is the last resort.
+        if pdfium is not None and _PIL_AVAILABLE:
+            backend = "pdfium"
+        elif fitz is not None:
+            backend = "fitz"
+        elif PdfReader is not None:
+            backend = "pypdf"
+        else:
+            logger.warning("No PDF library available; skipping figure extraction.")
+            return []
+        # A manifest records what an earlier run extracted with the same settings.
+        manifest_path = output_dir / f"{self.pdf_path.stem}_figures.json"
+        settings = {"limit": limit, "min_area": min_area}
+        manifest = self._load_manifest(manifest_path, settings)
+        if manifest is not None:
+            cached = [manifest_path.parent / name for name in manifest.get("figures", [])]
+            # Only trust the manifest while every figure it lists is still on disk.
+            if all(fig.exists() for fig in cached):
+                return cached
+        _ensure_dir(output_dir)
+        # Per-image failures are collected and reported once, so a damaged PDF logs a single
+        # summary instead of a warning per broken image.
+        failed: list[tuple[str, Exception]] = []
+        try:
+            if backend == "pdfium":
+                figures = _extract_figures_pdfium(
+                    self._pdfium(), self.pdf_path, output_dir, limit, min_area, failed
+                )
+            elif backend == "fitz":
+                figures = _extract_figures_fitz(
+                    self._fitz(), self.pdf_path, output_dir, limit, min_area, failed
+                )
+            else:
+                figures = _extract_figures_pypdf(
+                    self._source, self.pdf_path, output_dir, limit, min_area, failed
+                )
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to extract figures for %s: %s", self.pdf_path, exc)
+            return []
+        finally:
+            _report_failures(self.pdf_path, failed)
+        if failed:
+            # Don't let a transient failure (e.g. a full disk) stick for later runs.
+            return figures
+        _write_manifest(manifest_path, {**settings, "figures": [fig.name for fig in figures]})
+        return figures
 
-def extract_figures(pdf_path: Path, output_dir: Path, limit: int = 3) -> list[Path]:
-    if PdfReader is None:
-        logger.warning("pypdf not available; skipping figure extraction.")
-        return []
-    output_dir.mkdir(parents=True, exist_ok=True)
-    figures: list[Path] = []
-    try:
-        reader = PdfReader(str(pdf_path))
-        for page in reader.pages:
-            images = getattr(page, "images", None)
-            if not images:
+    def _is_fresh(self, output_path: Path) -> bool:
+        if self._pdf_mtime is None:
+            return False
+        try:
+            return os.stat(output_path).st_mtime >= self._pdf_mtime
+        except OSError:
+            return False
+
+    def _load_manifest(self, manifest_path: Path, settings: dict) -> dict | None:
+        if not self._is_fresh(manifest_path):
+            return None
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict):
+            return None
+        if any(manifest.get(key) != value for key, value in settings.items()):
+            return None
+        return manifest
+
+    def close(self) -> None:
+        # Documents hold views into the mapping, so they are closed before it is unmapped.
+        for doc in (self._pdfium_doc, self._fitz_doc):
+            if doc is not None:
+                doc.close()
+        self._pdfium_doc = self._fitz_doc = None
+        if self._fitz_view is not None:
+            self._fitz_view.release()
+            self._fitz_view = None
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:  # pragma: no cover - a library still holds a view; GC unmaps it
+                logger.debug("Deferred unmapping %s", self.pdf_path)
+            self._mm = None
+
+
+def extract_first_page_image(
+    pdf_path: Path,
+    output_dir: Path,
+    fmt: str = "jpeg",
+    dpi: int = 120,
+    target_width_px: int | None = None,
+) -> Path | None:
+    with AssetExtractor(pdf_path) as extractor:
+        return extractor.cover(output_dir, fmt=fmt, dpi=dpi, target_width_px=target_width_px)
+
+
+def extract_figures(
+    pdf_path: Path, output_dir: Path, limit: int = 3, min_area: int = MIN_FIGURE_AREA
+) -> list[Path]:
+    with AssetExtractor(pdf_path) as extractor:
+        return extractor.figures(output_dir, limit=limit, min_area=min_area)
+
+
+def extract_assets(
+    pdf_path: Path, output_dir: Path, limit: int = 3, min_area: int = MIN_FIGURE_AREA
+) -> PdfAssets:
+    with AssetExtractor(pdf_path) as extractor:
+        cover = extractor.cover(output_dir)
+        figures = (
+            extractor.figures(output_dir, limit=limit, min_area=min_area) if limit > 0 else []
+        )
+    return PdfAssets(cover_image=cover, figures=figures)
+
+
+def _render_cover_pdfium(
+    pdf, cover_path: Path, fmt: str, dpi: int, target_width_px: int | None = None
+) -> bool:
+    # PDFium renders pages noticeably faster than MuPDF. It is not thread-safe, so batch
+    # callers parallelize with processes (see extract_assets_batch).
+    if len(pdf) < 1:
+        return False
+    page = pdf[0]
+    # Derive the scale from the page width in points so the bitmap comes out at the target
+    # size directly, with no resize pass afterwards. PDFium rounds the bitmap size up, so
+    # aim a hair below the target to keep float error from adding a column.
+    if target_width_px:
+        scale = (target_width_px - 1e-6) / page.get_width()
+    else:
+        scale = dpi / 72.0
+    image = page.render(scale=scale).to_pil()
+    if fmt == "png":
+        image.save(cover_path, "PNG")
+    else:
+        image.convert("RGB").save(cover_path, "JPEG", quality=JPEG_QUALITY)
+    return True
+
+
+def _render_cover_fitz(
+    doc, cover_path: Path, fmt: str, dpi: int, target_width_px: int | None = None
+) -> bool:
+    if doc.page_count < 1:
+        return False
+    page = doc.load_page(0)
+    zoom = target_width_px / page.rect.width if target_width_px else dpi / 72.0
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False, colorspace=fitz.csRGB)
+    if fmt == "png":
+        pix.save(cover_path)
+    else:
+        cover_path.write_bytes(pix.tobytes("jpeg", jpg_quality=JPEG_QUALITY))
+    return True
+
+
+def _extract_figures_pdfium(
+    pdf,
+    pdf_path: Path,
+    output_dir: Path,
+    limit: int,
+    min_area: int,
+    failed: list[tuple[str, Exception]],
+) -> list[Path]:
+    # PDFium enumerates image objects in C (including those nested in form XObjects);
+    # JPEG/JPEG 2000 streams are written as-is, anything else is decoded and saved as PNG.
+    # Figures are collected first and written in one pass after enumeration.
+    pending: list[tuple[Path, bytes]] = []
+    # Digests of streams already written, so a logo repeated on every page is kept once.
+    seen: set[bytes] = set()
+    stem = pdf_path.stem
+    for page_number, page in enumerate(pdf, start=1):
+        # Stop before loading the next page once the quota is met.
+        if len(pending) >= limit:
+            break
+        images = page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,))
+        for index, image in enumerate(images, start=1):
+            if len(pending) >= limit:
+                break
+            try:
+                # Pixel size comes from the image dict, so small images cost no decode.
+                width, height = image.get_px_size()
+                if width * height < min_area:
+                    continue
+                # Hash the stored stream so duplicates are dropped before any decoding.
+                raw = image.get_data(decode_simple=False)
+                digest = hashlib.blake2b(raw, digest_size=8).digest()
+                if digest in seen:
+                    continue
+                seen.add(digest)
+                filters = image.get_filters()
+                if len(filters) == 1 and filters[0] in _PASSTHROUGH_FILTERS:
+                    ext = _PASSTHROUGH_FILTERS[filters[0]]
+                    data = raw
+                else:
+                    ext = "png"
+                    buf = io.BytesIO()
+                    image.get_bitmap().to_pil().save(buf, "PNG")
+                    data = buf.getbuffer()
+                fig_path = output_dir / f"{stem}_p{page_number}_img{index}.{ext}"
+                pending.append((fig_path, data))
+            except Exception as exc:  # pragma: no cover - defensive
+                failed.append((f"page {page_number} image {index}", exc))
+    return _write_figures(pending, failed)
+
+
+def _extract_figures_fitz(
+    doc,
+    pdf_path: Path,
+    output_dir: Path,
+    limit: int,
+    min_area: int,
+    failed: list[tuple[str, Exception]],
+) -> list[Path]:
+    # get_images() reports each image's size from its dict; extract_image() returns the
+    # stored stream where MuPDF can (JPEG etc.) rather than re-encoding it.
+    pending: list[tuple[Path, bytes]] = []
+    seen: set[bytes] = set()
+    stem = pdf_path.stem
+    for page_number, page in enumerate(doc, start=1):
+        if len(pending) >= limit:
+            break
+        for index, (xref, _smask, width, height, *_) in enumerate(
+            page.get_images(full=True), start=1
+        ):
+            if len(pending) >= limit:
+                break
+            if width * height < min_area:
+                continue
+            try:
+                info = doc.extract_image(xref)
+                data = info["image"]
+                digest = hashlib.blake2b(data, digest_size=8).digest()
+                if digest in seen:
+                    continue
+                seen.add(digest)
+                ext = "jpg" if info["ext"] == "jpeg" else info["ext"]
+                fig_path = output_dir / f"{stem}_p{page_number}_img{index}.{ext}"
+                pending.append((fig_path, data))
+            except Exception as exc:  # pragma: no cover - defensive
+                failed.append((f"page {page_number} image {index}", exc))
+    return _write_figures(pending, failed)
+
+
+def _extract_figures_pypdf(
+    source: Path | mmap.mmap,
+    pdf_path: Path,
+    output_dir: Path,
+    limit: int,
+    min_area: int,
+    failed: list[tuple[str, Exception]],
+) -> list[Path]:
+    pending: list[tuple[Path, bytes]] = []
+    seen: set[bytes] = set()
+    stem = pdf_path.stem
+    if isinstance(source, mmap.mmap):
+        # JPEG/JPEG 2000 payloads can be cut straight out of the file; pypdf only has to
+        # build its object model when that does not turn up enough figures.
+        pending = _scan_image_streams(source, stem, output_dir, limit, min_area, seen)
+        if len(pending) >= limit:
+            return _write_figures(pending, failed)
+    # pypdf reads an mmap like any seekable stream, so the mapping is not copied. Lenient
+    # parsing tolerates slightly broken xref tables; metadata is never touched.
+    reader = PdfReader(source if isinstance(source, mmap.mmap) else str(source), strict=False)
+    for page_number, page in enumerate(reader.pages, start=1):
+        # Stop before pypdf parses the next page's resources once the quota is met.
+        if len(pending) >= limit:
+            break
+        if "/Resources" not in page:
+            continue
+        # Read /Width and /Height from the XObject dicts first; page.images[...] only
+        # decodes the streams that are large enough to be figures.
+        for key, xobject in _iter_image_xobjects(page["/Resources"]):
+            if len(pending) >= limit:
+                break
+            try:
+                if int(xobject["/Width"]) * int(xobject["/Height"]) < min_area:
+                    continue
+                # Hash the still-encoded stream so duplicates are dropped without decoding
+                # them; for DCT/JPX these are the same bytes the raw scan hashed.
+                digest = hashlib.blake2b(_encoded_stream_bytes(xobject), digest_size=8).digest()
+                if digest in seen:
+                    continue
+                seen.add(digest)
+                image = page.images[key]
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.debug("Skipping image %s in %s: %s", key, pdf_path, exc)
+                continue
+            # pypdf names already carry the extension (e.g. "Im0.jpg"); the page number keeps
+            # same-named XObjects on different pages from overwriting each other.
+            safe_name = (image.name or "image.bin").translate(_UNSAFE_NAME_CHARS)
+            fig_path = output_dir / f"{stem}_p{page_number}_{safe_name}"
+            try:
+                pending.append((fig_path, image.data))
+            except Exception as exc:  # pragma: no cover - defensive
+                failed.append((fig_path.name, exc))
+    return _write_figures(pending, failed)
+
+
+def _encoded_stream_bytes(xobject) -> bytes:
+    # pypdf keeps an encoded stream's bytes in _data; get_data() would run the filters.
+    data = getattr(xobject, "_data", None)
+    return data if isinstance(data, bytes) else xobject.get_data()
+
+
+def _scan_image_streams(
+    mm: mmap.mmap, stem: str, output_dir: Path, limit: int, min_area: int, seen: set[bytes]
+) -> list[tuple[Path, bytes]]:
+    # Regex pass over the raw file for image objects whose only filter is DCTDecode or
+    # JPXDecode. Results are in file order, not page order; anything else (Flate images,
+    # encrypted files) is left to pypdf.
+    pending: list[tuple[Path, bytes]] = []
+    if mm.find(b"/Encrypt") != -1:
+        return pending
+    # Payloads are memoryview slices of the mapping: hashed and written without ever being
+    # copied into Python bytes objects.
+    view = memoryview(mm)
+    for match in _IMAGE_STREAM_HEADER.finditer(mm):
+        if len(pending) >= limit:
+            break
+        header = match.group(2)
+        filter_match = _SOLE_PASSTHROUGH_FILTER.search(header)
+        width, height = _WIDTH.search(header), _HEIGHT.search(header)
+        if filter_match is None or width is None or height is None:
+            continue
+        if int(width.group(1)) * int(height.group(1)) < min_area:
+            continue
+        start = match.end()
+        length = _DIRECT_LENGTH.search(header)
+        end = start + int(length.group(1)) if length else -1
+        if end < 0 or not _ENDSTREAM.match(mm, end):
+            # Indirect or wrong /Length: the payload runs up to the endstream keyword.
+            end = mm.find(b"endstream", start)
+            if end < 0:
                 continue
-            for image in images:
-                if len(figures) >= limit:
-                    return figures
-                ext = getattr(image, "extension", "bin")
-                name = getattr(image, "name", "image")
-                safe_name = name.replace("/", "_")
-                fig_path = output_dir / f"{pdf_path.stem}_{safe_name}.{ext}"
-                try:
-                    with open(fig_path, "wb") as fh:
-                        fh.write(image.data)
-                    figures.append(fig_path)
-                except Exception as exc:  # pragma: no cover - defensive
-                    logger.warning("Failed to save figure %s: %s", fig_path, exc)
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("Failed to extract figures for %s: %s", pdf_path, exc)
-    return figures
+            while end > start and mm[end - 1] in b"\r\n":
+                end -= 1
+        data = view[start:end]
+        digest = hashlib.blake2b(data, digest_size=8).digest()
+        if digest in seen:
+            continue
+        seen.add(digest)
+        ext = _PASSTHROUGH_FILTERS[(filter_match.group(1) or filter_match.group(2)).decode()]
+        pending.append((output_dir / f"{stem}_obj{int(match.group(1))}.{ext}", data))
+    return pending
+
+
+def _iter_image_xobjects(
+    resources, ancestors: tuple[str, ...] = ()
+) -> Iterator[tuple[str | tuple[str, ...], object]]:
+    # Yields (key, xobject) for image XObjects, descending into form XObjects; the key is
+    # what page.images[...] expects. Depth is capped to survive self-referencing forms.
+    xobjects = resources.get_object().get("/XObject")
+    if xobjects is None:
+        return
+    for name, ref in xobjects.get_object().items():
+        xobject = ref.get_object()
+        subtype = xobject.get("/Subtype")
+        if subtype == "/Image":
+            yield ((*ancestors, name) if ancestors else name), xobject
+        elif subtype == "/Form" and "/Resources" in xobject and len(ancestors) < 8:
+            yield from _iter_image_xobjects(xobject["/Resources"], (*ancestors, name))
+
+
+def _write_figures(
+    pending: list[tuple[Path, bytes]], failed: list[tuple[str, Exception]]
+) -> list[Path]:
+    # Back-to-back creates in one directory keep its inode hot; failures drop only that file.
+    written: list[Path] = []
+    for fig_path, data in pending:
+        try:
+            _write_bytes(fig_path, data)
+            written.append(fig_path)
+        except OSError as exc:
+            failed.append((fig_path.name, exc))
+    return written
+
+
+def _report_failures(pdf_path: Path, failed: list[tuple[str, Exception]]) -> None:
+    if failed and logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Failed to extract %d figure(s) from %s: %s",
+            len(failed),
+            pdf_path,
+            "; ".join(f"{what}: {exc}" for what, exc in failed[:3]),
+        )
+
+
+def _write_manifest(manifest_path: Path, manifest: dict) -> None:
+    try:
+        manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    except OSError as exc:  # pragma: no cover - defensive
+        logger.debug("Failed to write %s: %s", manifest_path, exc)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    # The blob is already complete, so write it straight to a raw fd (no BufferedWriter copy).
+    fd = os.open(os.fsencode(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Figures are never read back by this process; keep their pages from pushing the
+        # PDFs still being parsed out of the page cache.
+        _fadvise(fd, "POSIX_FADV_NOREUSE")
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        _fadvise(fd, "POSIX_FADV_DONTNEED")
+    finally:
+        os.close(fd)
+
+
+def _fadvise(fd: int, advice: str) -> None:
+    if not hasattr(os, "posix_fadvise") or not hasattr(os, advice):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+    except OSError as exc:  # pragma: no cover - advisory only
+        logger.debug("posix_fadvise(%s) failed: %s", advice, exc)
+
+
+def _extract_one(pdf_path_str: str, output_dir_str: str, limit: int) -> PdfAssets:
+    # Module-level so it pickles; each worker opens its own documents.
+    return extract_assets(Path(pdf_path_str), Path(output_dir_str), limit=limit)
+
+
+def extract_assets_batch(
+    pdf_paths: Sequence[Path],
+    output_dir: Path | None = None,
+    limit: int = 3,
+) -> Iterator[tuple[Path, PdfAssets]]:
+    # Yields (pdf_path, assets) as each PDF finishes; output_dir defaults to an images/
+    # folder next to each PDF.
+    jobs = [(pdf_path, output_dir or pdf_path.parent / "images") for pdf_path in pdf_paths]
+    if len(jobs) <= 1:
+        for pdf_path, out_dir in jobs:
+            yield pdf_path, _extract_one(str(pdf_path), str(out_dir), limit)
+        return
+
+    # Rendering is CPU-bound and fitz documents don't pickle, so each PDF runs in its own
+    # worker; spawn avoids fork-after-threads problems with MuPDF.
+    workers = min(os.cpu_count() or 1, 6, len(jobs))
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {
+            executor.submit(_extract_one, str(pdf_path), str(out_dir), limit): pdf_path
+            for pdf_path, out_dir in jobs
+        }
+        for future in as_completed(futures):
+            pdf_path = futures[future]
+            try:
+                yield pdf_path, future.result()
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("Failed to extract assets for %s: %s", pdf_path, exc)